@@ -1,5 +1,5 @@
-import { Notice, Plugin, TFile } from 'obsidian';
-import { YouTubeSummarySettings, DEFAULT_SETTINGS } from './types';
+import { debounce, Notice, Plugin, TFile, TFolder } from 'obsidian';
+import { YouTubeSummarySettings, DEFAULT_SETTINGS, TranscriptResult, ProcessedSections } from './types';
 import { YouTubeSummarySettingTab } from './settings';
 import { VideoIdExtractor } from './processors/videoIdExtractor';
 import { TranscriptDownloader } from './processors/transcriptDownloader';
@@ -14,9 +14,16 @@ import {
 
 export default class YouTubeSummaryPlugin extends Plugin {
 	settings: YouTubeSummarySettings;
+	private transcriptDownloader: TranscriptDownloader;
+	private aiProcessor: AIProcessor | null = null;
+	private folderRunInProgress = false;
 
 	async onload() {
 		await this.loadSettings();
+		this.transcriptDownloader = new TranscriptDownloader(
+			this.settings.maxRetries,
+			this.settings.debugLogging
+		);
 
 		this.addRibbonIcon('youtube', 'Process YouTube Note', async () => {
 			await this.processCurrentNote();
@@ -37,6 +44,21 @@ export default class YouTubeSummaryPlugin extends Plugin {
 			}
 		});
 
+		this.addCommand({
+			id: 'process-youtube-folder',
+			name: 'Process all notes in current folder',
+			checkCallback: (checking: boolean) => {
+				const folder = this.app.workspace.getActiveFile()?.parent;
+				if (folder) {
+					if (!checking) {
+						this.processFolderNotes(folder);
+					}
+					return true;
+				}
+				return false;
+			}
+		});
+
 		this.addCommand({
 			id: 'open-settings',
 			name: 'Open Settings',
@@ -50,10 +72,21 @@ export default class YouTubeSummaryPlugin extends Plugin {
 
 		this.addSettingTab(new YouTubeSummarySettingTab(this.app, this));
 
+		// Registered after layout is ready so notes restored at startup do not trigger requests
+		this.app.workspace.onLayoutReady(() => {
+			this.registerEvent(this.app.workspace.on('file-open', (file) => {
+				if (file) {
+					this.preconnectForNote(file);
+				}
+			}));
+		});
+
 		console.log('YouTube Deep Learning Note plugin loaded');
 	}
 
 	onunload() {
+		// Flush a pending settings write (Debouncer.run is not available on older Obsidian)
+		this.writeSettingsDebounced.run?.();
 		console.log('YouTube Deep Learning Note plugin unloaded');
 	}
 
@@ -62,9 +95,28 @@ export default class YouTubeSummaryPlugin extends Plugin {
 	}
 
 	async saveSettings() {
+		this.applySettings();
 		await this.saveData(this.settings);
 	}
 
+	/**
+	 * For text inputs that change on every keystroke: apply immediately,
+	 * but coalesce the data.json writes until typing pauses.
+	 */
+	saveSettingsDebounced(): void {
+		this.applySettings();
+		this.writeSettingsDebounced();
+	}
+
+	private writeSettingsDebounced = debounce(() => this.saveData(this.settings), 1000, true);
+
+	private applySettings(): void {
+		this.transcriptDownloader?.setMaxRetries(this.settings.maxRetries);
+		this.transcriptDownloader?.setDebugLogging(this.settings.debugLogging);
+		// Rebuilt lazily so the next run picks up the new key/model
+		this.aiProcessor = null;
+	}
+
 	async processCurrentNote(): Promise<void> {
 		const activeFile = this.app.workspace.getActiveFile();
 
@@ -79,8 +131,7 @@ export default class YouTubeSummaryPlugin extends Plugin {
 
 			new Notice('📥 Downloading transcript...', 4000);
 
-			const transcriptDownloader = new TranscriptDownloader(this.settings.maxRetries);
-			const transcriptResult = await transcriptDownloader.downloadWithMetadata(
+			const transcriptResult = await this.transcriptDownloader.downloadWithMetadata(
 				videoId,
 				this.settings.preferredLanguages
 			);
@@ -89,40 +140,144 @@ export default class YouTubeSummaryPlugin extends Plugin {
 
 			new Notice('🤖 Generating AI summary... (this may take 30-60s)', 60000);
 
+			const processedSections = await this.generateSections(transcriptResult);
+
+			new Notice('✓ AI processing completed', 3000);
+
+			new Notice('📝 Updating note...');
+
+			await this.writeSections(activeFile, videoId, transcriptResult, processedSections);
+
+			new Notice('✅ Note processing completed!', 5000);
+
+		} catch (error) {
+			this.handleError(error);
+		}
+	}
+
+	async processFolderNotes(folder: TFolder): Promise<void> {
+		if (this.folderRunInProgress) {
+			new Notice('⏳ A folder is already being processed. Please wait for it to finish.');
+			return;
+		}
+
 		if (!this.settings.claudeApiKey) {
-			throw new APIKeyMissingError();
+			this.handleError(new APIKeyMissingError());
+			return;
 		}
 
-		const aiProcessor = new AIProcessor({
-			apiKey: this.settings.claudeApiKey,
-			model: this.settings.aiModel,
-			maxTokens: this.settings.maxTokens
-		});
-			const processedSections = await aiProcessor.processAllSections(
-				transcriptResult.text,
-				transcriptResult.metadata
-			);
+		this.folderRunInProgress = true;
+		const progress = new Notice('📂 Scanning folder for YouTube notes...', 0);
 
-			new Notice('✓ AI processing completed', 3000);
+		try {
+			const videoIds = new Map<TFile, string>();
+			for (const child of folder.children) {
+				if (!(child instanceof TFile) || child.extension !== 'md') continue;
+				try {
+					videoIds.set(child, await this.extractVideoIdFromNote(child));
+				} catch {
+					// Not a YouTube note
+				}
+			}
 
-			new Notice('📝 Updating note...');
+			if (videoIds.size === 0) {
+				new Notice('❌ No YouTube notes found in this folder.');
+				return;
+			}
 
-			const currentContent = await this.app.vault.read(activeFile);
+			progress.setMessage(`📥 Downloading ${videoIds.size} transcripts...`);
 
-			const noteUpdater = new NoteUpdater();
-			const updatedContent = noteUpdater.updateFlexible(
-				currentContent, 
-				processedSections, 
-				transcriptResult.segments,
-				videoId
+			const transcripts = await this.transcriptDownloader.downloadMany(
+				Array.from(new Set(videoIds.values())),
+				this.settings.preferredLanguages
 			);
 
-			await this.app.vault.modify(activeFile, updatedContent);
+			// AI requests stay sequential to respect Claude rate limits
+			let processed = 0;
+			let index = 0;
+			for (const [file, videoId] of Array.from(videoIds)) {
+				index++;
+				progress.setMessage(`🤖 Summarizing ${file.basename} (${index}/${videoIds.size})...`);
+
+				try {
+					const transcriptResult = transcripts.get(videoId);
+					if (!transcriptResult || transcriptResult instanceof Error) {
+						throw transcriptResult ?? new TranscriptNotFoundError();
+					}
 
-			new Notice('✅ Note processing completed!', 5000);
+					const processedSections = await this.generateSections(transcriptResult);
+					await this.writeSections(file, videoId, transcriptResult, processedSections);
+					processed++;
+				} catch (error) {
+					this.handleError(error);
+				}
+			}
 
+			new Notice(`✅ Processed ${processed}/${videoIds.size} notes`, 5000);
 		} catch (error) {
 			this.handleError(error);
+		} finally {
+			progress.hide();
+			this.folderRunInProgress = false;
+		}
+	}
+
+	private async generateSections(transcriptResult: TranscriptResult): Promise<ProcessedSections> {
+		if (!this.settings.claudeApiKey) {
+			throw new APIKeyMissingError();
+		}
+
+		return this.getAIProcessor().processAllSections(
+			transcriptResult.text,
+			transcriptResult.metadata
+		);
+	}
+
+	private async writeSections(
+		file: TFile,
+		videoId: string,
+		transcriptResult: TranscriptResult,
+		processedSections: ProcessedSections
+	): Promise<void> {
+		const noteUpdater = new NoteUpdater();
+		const applyUpdate = (currentContent: string) => noteUpdater.updateFlexible(
+			currentContent,
+			processedSections,
+			transcriptResult.segments,
+			videoId
+		);
+
+		// vault.process (Obsidian 1.1+) reads and writes in a single vault operation
+		if (typeof this.app.vault.process === 'function') {
+			await this.app.vault.process(file, applyUpdate);
+		} else {
+			await this.app.vault.modify(file, applyUpdate(await this.app.vault.read(file)));
+		}
+	}
+
+	private getAIProcessor(): AIProcessor {
+		if (!this.aiProcessor) {
+			this.aiProcessor = new AIProcessor({
+				apiKey: this.settings.claudeApiKey,
+				model: this.settings.aiModel,
+				maxTokens: this.settings.maxTokens
+			});
+		}
+		return this.aiProcessor;
+	}
+
+	private preconnectForNote(file: TFile): void {
+		if (!this.settings.preconnectOnOpen) return;
+
+		const sourceUrl = this.app.metadataCache.getFileCache(file)?.frontmatter?.source_url;
+		if (!sourceUrl) return;
+
+		try {
+			// Throws for non-YouTube URLs
+			new VideoIdExtractor().extract(sourceUrl);
+			this.transcriptDownloader.preconnect();
+		} catch {
+			// Not a YouTube note
 		}
 	}
 
@@ -11,8 +11,53 @@ import { sleep } from '../utils/helpers';
 const USER_AGENT =
 	'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36';
 
+// None of these set Accept-Encoding: requestUrl already advertises gzip/br and
+// decodes the body, and an explicit header can turn that decoding off
+const WATCH_PAGE_HEADERS: Record<string, string> = {
+	'User-Agent': USER_AGENT,
+	'Accept-Language': 'en-US,en;q=0.9',
+};
+
+const INNERTUBE_HEADERS: Record<string, string> = {
+	'Content-Type': 'application/json',
+	'User-Agent': USER_AGENT,
+	'Accept': 'application/json',
+};
+
+const CAPTION_HEADERS: Record<string, string> = {
+	'User-Agent': USER_AGENT,
+};
+
+const PRECONNECT_HEADERS: Record<string, string> = {
+	'User-Agent': USER_AGENT,
+};
+
+const CACHE_TTL_MS = 60 * 60 * 1000;
+const CACHE_MAX_ENTRIES = 50;
+
+const PRECONNECT_INTERVAL_MS = 30 * 1000;
+
+const RE_INNERTUBE_API_KEY = /"INNERTUBE_API_KEY":\s*"([a-zA-Z0-9_-]+)"/;
+
+const RE_WHITESPACE = /\s+/g;
+
 const RE_XML_TRANSCRIPT = /<text start="([^"]*)" dur="([^"]*)">([^<]*)<\/text>/g;
 
+const RE_AMP_ENTITY = /&amp;/g;
+const RE_HTML_ENTITY = /&(?:(lt|gt|quot|apos)|#(\d+)|#x([0-9a-fA-F]+));/g;
+
+const NAMED_ENTITIES: Record<string, string> = {
+	lt: '<',
+	gt: '>',
+	quot: '"',
+	apos: "'",
+};
+
+interface CachedTranscript {
+	result: TranscriptResult;
+	fetchedAt: number;
+}
+
 interface CaptionTrack {
 	baseUrl: string;
 	languageCode: string;
@@ -22,64 +67,48 @@ interface CaptionTrack {
 
 export class TranscriptDownloader {
 	private maxRetries: number;
+	private debugLogging: boolean;
+	private apiKeyRequest: Promise<string> | null = null;
+	private cache = new Map<string, CachedTranscript>();
+	private lastPreconnectAt = 0;
+
+	constructor(maxRetries: number = 3, debugLogging: boolean = false) {
+		this.maxRetries = maxRetries;
+		this.debugLogging = debugLogging;
+	}
 
-	constructor(maxRetries: number = 3) {
+	setMaxRetries(maxRetries: number): void {
 		this.maxRetries = maxRetries;
 	}
 
+	setDebugLogging(debugLogging: boolean): void {
+		this.debugLogging = debugLogging;
+	}
+
+	private log(message: string): void {
+		if (this.debugLogging) {
+			console.log(message);
+		}
+	}
+
 	async download(
 		videoId: string,
 		languages: string[] = ['ko', 'en']
 	): Promise<TranscriptResult> {
+		const cacheKey = `${videoId}:${languages.join(',')}`;
+		const cached = this.cache.get(cacheKey);
+		if (cached && Date.now() - cached.fetchedAt < CACHE_TTL_MS) {
+			this.log(`Using cached transcript for ${videoId}`);
+			return cached.result;
+		}
+
 		let lastError: Error | null = null;
 
 		for (let attempt = 0; attempt < this.maxRetries; attempt++) {
 			try {
-				console.log(`Downloading transcript for ${videoId} (attempt ${attempt + 1}/${this.maxRetries})`);
-
-				const watchPageResponse = await requestUrl({
-					url: `https://www.youtube.com/watch?v=${videoId}`,
-					headers: {
-						'User-Agent': USER_AGENT,
-						'Accept-Language': 'en-US,en;q=0.9',
-					},
-				});
-
-				const pageHtml = watchPageResponse.text;
+				this.log(`Downloading transcript for ${videoId} (attempt ${attempt + 1}/${this.maxRetries})`);
 
-				if (pageHtml.includes('class="g-recaptcha"')) {
-					throw new TranscriptNotFoundError(
-						'YouTube is receiving too many requests. Please try again later.'
-					);
-				}
-
-				const apiKeyMatch = pageHtml.match(/"INNERTUBE_API_KEY":\s*"([a-zA-Z0-9_-]+)"/);
-				if (!apiKeyMatch?.[1]) {
-					throw new TranscriptNotFoundError('Could not extract YouTube API key');
-				}
-
-				const innertubeResponse = await requestUrl({
-					url: `https://www.youtube.com/youtubei/v1/player?key=${apiKeyMatch[1]}`,
-					method: 'POST',
-					headers: {
-						'Content-Type': 'application/json',
-						'User-Agent': USER_AGENT,
-						'Accept': 'application/json',
-					},
-					body: JSON.stringify({
-						context: {
-							client: {
-								clientName: 'WEB',
-								clientVersion: '2.20231219.00.00',
-								hl: 'en',
-								gl: 'US',
-							},
-						},
-						videoId: videoId,
-					}),
-				});
-
-				const videoData = innertubeResponse.json;
+				const videoData = await this.fetchPlayerData(videoId);
 
 				const videoDetails = videoData?.videoDetails;
 				const metadata: VideoMetadata = {
@@ -103,11 +132,11 @@ export class TranscriptDownloader {
 					);
 				}
 
-				console.log(`Found transcript in language: ${captionTrack.languageCode}`);
+				this.log(`Found transcript in language: ${captionTrack.languageCode}`);
 
 				const transcriptResponse = await requestUrl({
 					url: captionTrack.baseUrl,
-					headers: { 'User-Agent': USER_AGENT },
+					headers: CAPTION_HEADERS,
 				});
 
 				const transcriptXml = transcriptResponse.text;
@@ -120,20 +149,18 @@ export class TranscriptDownloader {
 					throw new TranscriptNotFoundError('Could not parse transcript');
 				}
 
-				const decodedSegments = segments.map(s => ({
-					...s,
-					text: this.decodeHTMLEntities(s.text)
-				}));
-
-				const fullText = decodedSegments
+				const fullText = segments
 					.map(s => s.text)
 					.join(' ')
-					.replace(/\s+/g, ' ')
+					.replace(RE_WHITESPACE, ' ')
 					.trim();
 
-				console.log(`Transcript downloaded: ${fullText.length} characters`);
+				this.log(`Transcript downloaded: ${fullText.length} characters`);
+
+				const result: TranscriptResult = { text: fullText, segments, metadata };
+				this.remember(cacheKey, result);
 
-				return { text: fullText, segments: decodedSegments, metadata };
+				return result;
 
 			} catch (error) {
 				lastError = error as Error;
@@ -148,7 +175,7 @@ export class TranscriptDownloader {
 				}
 
 				const delay = 1000 * Math.pow(2, attempt);
-				console.log(`Waiting ${delay}ms before retry...`);
+				this.log(`Waiting ${delay}ms before retry...`);
 				await sleep(delay);
 			}
 		}
@@ -158,6 +185,89 @@ export class TranscriptDownloader {
 		);
 	}
 
+	private remember(cacheKey: string, result: TranscriptResult): void {
+		this.cache.delete(cacheKey);
+		this.cache.set(cacheKey, { result, fetchedAt: Date.now() });
+
+		if (this.cache.size > CACHE_MAX_ENTRIES) {
+			const oldestKey = this.cache.keys().next().value;
+			if (oldestKey !== undefined) {
+				this.cache.delete(oldestKey);
+			}
+		}
+	}
+
+	private async fetchPlayerData(videoId: string): Promise<any> {
+		const apiKeyRequest = this.getInnertubeApiKey(videoId);
+		const apiKey = await apiKeyRequest;
+
+		try {
+			const innertubeResponse = await requestUrl({
+				url: `https://www.youtube.com/youtubei/v1/player?key=${apiKey}`,
+				method: 'POST',
+				headers: INNERTUBE_HEADERS,
+				body: JSON.stringify({
+					context: {
+						client: {
+							clientName: 'WEB',
+							clientVersion: '2.20231219.00.00',
+							hl: 'en',
+							gl: 'US',
+						},
+					},
+					videoId: videoId,
+				}),
+			});
+
+			return innertubeResponse.json;
+		} catch (error) {
+			// A 4xx from the player endpoint means the cached key was rejected; fetch a
+			// fresh watch page on retry. Other failures keep the key for concurrent downloads.
+			const status = (error as any)?.status;
+			if (status >= 400 && status < 500 && this.apiKeyRequest === apiKeyRequest) {
+				this.apiKeyRequest = null;
+			}
+			throw error;
+		}
+	}
+
+	/**
+	 * The watch page is only needed for the innertube API key, which is shared
+	 * by every video, so it is fetched once and reused by later downloads.
+	 */
+	private getInnertubeApiKey(videoId: string): Promise<string> {
+		if (!this.apiKeyRequest) {
+			const request = this.fetchInnertubeApiKey(videoId);
+			request.catch(() => {
+				if (this.apiKeyRequest === request) this.apiKeyRequest = null;
+			});
+			this.apiKeyRequest = request;
+		}
+		return this.apiKeyRequest;
+	}
+
+	private async fetchInnertubeApiKey(videoId: string): Promise<string> {
+		const watchPageResponse = await requestUrl({
+			url: `https://www.youtube.com/watch?v=${videoId}`,
+			headers: WATCH_PAGE_HEADERS,
+		});
+
+		const pageHtml = watchPageResponse.text;
+
+		if (pageHtml.includes('class="g-recaptcha"')) {
+			throw new TranscriptNotFoundError(
+				'YouTube is receiving too many requests. Please try again later.'
+			);
+		}
+
+		const apiKeyMatch = pageHtml.match(RE_INNERTUBE_API_KEY);
+		if (!apiKeyMatch?.[1]) {
+			throw new TranscriptNotFoundError('Could not extract YouTube API key');
+		}
+
+		return apiKeyMatch[1];
+	}
+
 	private findBestCaptionTrack(
 		tracks: CaptionTrack[],
 		preferredLanguages: string[]
@@ -186,7 +296,7 @@ export class TranscriptDownloader {
 			results.push({
 				offset: parseFloat(match[1]),
 				duration: parseFloat(match[2]),
-				text: match[3]
+				text: this.decodeHTMLEntities(match[3])
 			});
 		}
 
@@ -207,28 +317,64 @@ export class TranscriptDownloader {
 	}
 
 	private decodeHTMLEntities(text: string): string {
-		const entities: Record<string, string> = {
-			'&amp;': '&',
-			'&lt;': '<',
-			'&gt;': '>',
-			'&quot;': '"',
-			'&#39;': "'",
-			'&apos;': "'",
-		};
-
-		let decoded = text;
-		for (const [entity, char] of Object.entries(entities)) {
-			decoded = decoded.replace(new RegExp(entity, 'g'), char);
+		if (text.indexOf('&') === -1) {
+			return text;
 		}
 
-		decoded = decoded.replace(/&#(\d+);/g, (_, num) => 
-			String.fromCharCode(parseInt(num, 10))
-		);
-		decoded = decoded.replace(/&#x([0-9a-fA-F]+);/g, (_, hex) => 
-			String.fromCharCode(parseInt(hex, 16))
-		);
+		// '&amp;' is decoded first so double-encoded captions ('&amp;#39;') come out clean
+		return text
+			.replace(RE_AMP_ENTITY, '&')
+			.replace(RE_HTML_ENTITY, (_, named: string, dec: string, hex: string) =>
+				named
+					? NAMED_ENTITIES[named]
+					: String.fromCharCode(dec ? parseInt(dec, 10) : parseInt(hex, 16))
+			);
+	}
+
+	/**
+	 * Warm the connection to YouTube with a lightweight HEAD request ahead of
+	 * a download. Throttled so switching between notes does not spam requests;
+	 * errors are ignored and surface from the actual download instead.
+	 */
+	preconnect(): void {
+		const now = Date.now();
+		if (now - this.lastPreconnectAt < PRECONNECT_INTERVAL_MS) return;
+		this.lastPreconnectAt = now;
+
+		requestUrl({
+			url: 'https://www.youtube.com/',
+			method: 'HEAD',
+			headers: PRECONNECT_HEADERS,
+		}).catch(() => undefined);
+	}
 
-		return decoded;
+	/**
+	 * Download transcripts for several videos with a bounded number of
+	 * requests in flight. Failures are returned per video instead of thrown.
+	 */
+	async downloadMany(
+		videoIds: string[],
+		languages: string[] = ['ko', 'en'],
+		concurrency: number = 4
+	): Promise<Map<string, TranscriptResult | Error>> {
+		const results = new Map<string, TranscriptResult | Error>();
+		let next = 0;
+
+		const worker = async () => {
+			while (next < videoIds.length) {
+				const videoId = videoIds[next++];
+				try {
+					results.set(videoId, await this.download(videoId, languages));
+				} catch (error) {
+					results.set(videoId, error as Error);
+				}
+			}
+		};
+
+		const workerCount = Math.min(concurrency, videoIds.length);
+		await Promise.all(Array.from({ length: workerCount }, worker));
+
+		return results;
 	}
 
 	async downloadWithMetadata(
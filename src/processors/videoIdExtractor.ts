@@ -1,6 +1,11 @@
 import { VideoIdNotFoundError } from '../utils/errors';
 import { sanitizeVideoId } from '../utils/helpers';
 
+const RE_WATCH_URL = /[?&]v=([a-zA-Z0-9_-]{11})/;
+const RE_SHORT_URL = /youtu\.be\/([a-zA-Z0-9_-]{11})/;
+const RE_EMBED_URL = /youtube\.com\/embed\/([a-zA-Z0-9_-]{11})/;
+const RE_GENERIC_URL = /(?:youtube\.com|youtu\.be).*?([a-zA-Z0-9_-]{11})/;
+
 export class VideoIdExtractor {
 	/**
 	 * Extract YouTube video ID from various URL formats
@@ -16,29 +21,25 @@ export class VideoIdExtractor {
 		}
 
 		// Pattern 1: youtube.com/watch?v=VIDEO_ID
-		const watchPattern = /[?&]v=([a-zA-Z0-9_-]{11})/;
-		let match = url.match(watchPattern);
+		let match = url.match(RE_WATCH_URL);
 		if (match) {
 			return sanitizeVideoId(match[1]);
 		}
 
 		// Pattern 2: youtu.be/VIDEO_ID
-		const shortPattern = /youtu\.be\/([a-zA-Z0-9_-]{11})/;
-		match = url.match(shortPattern);
+		match = url.match(RE_SHORT_URL);
 		if (match) {
 			return sanitizeVideoId(match[1]);
 		}
 
 		// Pattern 3: youtube.com/embed/VIDEO_ID
-		const embedPattern = /youtube\.com\/embed\/([a-zA-Z0-9_-]{11})/;
-		match = url.match(embedPattern);
+		match = url.match(RE_EMBED_URL);
 		if (match) {
 			return sanitizeVideoId(match[1]);
 		}
 
 		// Pattern 4: Try to extract any 11-character alphanumeric string after common YouTube patterns
-		const genericPattern = /(?:youtube\.com|youtu\.be).*?([a-zA-Z0-9_-]{11})/;
-		match = url.match(genericPattern);
+		match = url.match(RE_GENERIC_URL);
 		if (match) {
 			return sanitizeVideoId(match[1]);
 		}
@@ -26,9 +26,9 @@ export class YouTubeSummarySettingTab extends PluginSettingTab {
 			.addText(text => text
 				.setPlaceholder('sk-ant-...')
 				.setValue(this.plugin.settings.claudeApiKey)
-				.onChange(async (value) => {
+				.onChange((value) => {
 					this.plugin.settings.claudeApiKey = value;
-					await this.plugin.saveSettings();
+					this.plugin.saveSettingsDebounced();
 				}));
 
 		new Setting(containerEl)
@@ -52,11 +52,11 @@ export class YouTubeSummarySettingTab extends PluginSettingTab {
 			.addText(text => text
 				.setPlaceholder('16000')
 				.setValue(String(this.plugin.settings.maxTokens))
-				.onChange(async (value) => {
+				.onChange((value) => {
 					const num = parseInt(value);
 					if (!isNaN(num) && num >= 4000 && num <= 32000) {
 						this.plugin.settings.maxTokens = num;
-						await this.plugin.saveSettings();
+						this.plugin.saveSettingsDebounced();
 					}
 				}));
 
@@ -69,10 +69,10 @@ export class YouTubeSummarySettingTab extends PluginSettingTab {
 			.addText(text => text
 				.setPlaceholder('ko,en')
 				.setValue(this.plugin.settings.preferredLanguages.join(','))
-				.onChange(async (value) => {
+				.onChange((value) => {
 					this.plugin.settings.preferredLanguages =
 						value.split(',').map(s => s.trim()).filter(s => s.length > 0);
-					await this.plugin.saveSettings();
+					this.plugin.saveSettingsDebounced();
 				}));
 
 		// Advanced Settings Section
@@ -84,11 +84,11 @@ export class YouTubeSummarySettingTab extends PluginSettingTab {
 			.addText(text => text
 				.setPlaceholder('3')
 				.setValue(String(this.plugin.settings.maxRetries))
-				.onChange(async (value) => {
+				.onChange((value) => {
 					const num = parseInt(value);
 					if (!isNaN(num) && num > 0 && num <= 10) {
 						this.plugin.settings.maxRetries = num;
-						await this.plugin.saveSettings();
+						this.plugin.saveSettingsDebounced();
 					}
 				}));
 
@@ -98,14 +98,34 @@ export class YouTubeSummarySettingTab extends PluginSettingTab {
 			.addText(text => text
 				.setPlaceholder('120')
 				.setValue(String(this.plugin.settings.timeoutSeconds))
-				.onChange(async (value) => {
+				.onChange((value) => {
 					const num = parseInt(value);
 					if (!isNaN(num) && num > 0 && num <= 600) {
 						this.plugin.settings.timeoutSeconds = num;
-						await this.plugin.saveSettings();
+						this.plugin.saveSettingsDebounced();
 					}
 				}));
 
+		new Setting(containerEl)
+			.setName('Debug Logging')
+			.setDesc('Log transcript download progress to the developer console')
+			.addToggle(toggle => toggle
+				.setValue(this.plugin.settings.debugLogging)
+				.onChange(async (value) => {
+					this.plugin.settings.debugLogging = value;
+					await this.plugin.saveSettings();
+				}));
+
+		new Setting(containerEl)
+			.setName('Preconnect to YouTube')
+			.setDesc('When a note with a YouTube source_url is opened, send a lightweight request to youtube.com so processing starts faster. Sends background traffic even if you do not process the note.')
+			.addToggle(toggle => toggle
+				.setValue(this.plugin.settings.preconnectOnOpen)
+				.onChange(async (value) => {
+					this.plugin.settings.preconnectOnOpen = value;
+					await this.plugin.saveSettings();
+				}));
+
 		// Help Section
 		containerEl.createEl('h3', { text: 'Usage' });
 		const usageDiv = containerEl.createDiv();
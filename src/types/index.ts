@@ -52,6 +52,8 @@ export interface YouTubeSummarySettings {
 	timeoutSeconds: number;
 	aiModel: ClaudeModel;
 	maxTokens: number;
+	debugLogging: boolean;
+	preconnectOnOpen: boolean;
 }
 
 export const DEFAULT_SETTINGS: YouTubeSummarySettings = {
@@ -60,5 +62,7 @@ export const DEFAULT_SETTINGS: YouTubeSummarySettings = {
 	maxRetries: 3,
 	timeoutSeconds: 120,
 	aiModel: 'claude-sonnet-4-20250514',
-	maxTokens: 16000
+	maxTokens: 16000,
+	debugLogging: false,
+	preconnectOnOpen: false
 };
@@ -1,18 +1,29 @@
 // 플러그인 테스트 스크립트
 import Anthropic from '@anthropic-ai/sdk';
 
-const VIDEO_URL = process.env.VIDEO_URL || 'https://youtu.be/cQNfCj7xTcU';
+// 쉼표로 구분해서 여러 영상을 한 번에 테스트할 수 있음
+const VIDEO_URLS = (process.env.VIDEO_URL || 'https://youtu.be/cQNfCj7xTcU')
+  .split(',')
+  .map(url => url.trim())
+  .filter(url => url.length > 0);
 const API_KEY = process.env.CLAUDE_API_KEY || '';
 
+// fetch는 전역 커넥션 풀(keep-alive)을 공유하므로 헤더만 모듈 상수로 재사용
+// Accept-Encoding은 fetch가 자동으로 붙이고(br, gzip, deflate) 응답도 알아서 풀어줌
+const HEADERS = {
+  'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+  'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7'
+};
+
 // ============ 1. 비디오 ID 추출 ============
-function extractVideoId(url) {
-  const patterns = [
-    /[?&]v=([a-zA-Z0-9_-]{11})/,
-    /youtu\.be\/([a-zA-Z0-9_-]{11})/,
-    /youtube\.com\/embed\/([a-zA-Z0-9_-]{11})/,
-  ];
+const VIDEO_ID_PATTERNS = [
+  /[?&]v=([a-zA-Z0-9_-]{11})/,
+  /youtu\.be\/([a-zA-Z0-9_-]{11})/,
+  /youtube\.com\/embed\/([a-zA-Z0-9_-]{11})/,
+];
 
-  for (const pattern of patterns) {
+function extractVideoId(url) {
+  for (const pattern of VIDEO_ID_PATTERNS) {
     const match = url.match(pattern);
     if (match) return match[1];
   }
@@ -20,29 +31,106 @@ function extractVideoId(url) {
 }
 
 // ============ 2. 자막 다운로드 ============
+const RE_PLAYER_RESPONSE_START = /ytInitialPlayerResponse\s*=\s*\{/;
+const RE_PLAYER_RESPONSE_SEARCH = new RegExp(RE_PLAYER_RESPONSE_START.source, 'g');
+const SCAN_OVERLAP = 64;
+
+// 정규식 대신 중괄호 균형을 한 번만 스캔해서 JSON 객체 끝을 찾음
+function extractPlayerResponse(html) {
+  const match = RE_PLAYER_RESPONSE_START.exec(html);
+  if (!match) return null;
+
+  const start = match.index + match[0].length - 1;
+  let depth = 0;
+
+  for (let i = start; i < html.length; i++) {
+    const ch = html[i];
+    if (ch === '"') {
+      // 문자열 본문은 네이티브 indexOf로 건너뜀 (플레이어 응답 대부분이 문자열)
+      i = findStringEnd(html, i);
+      if (i === -1) return null;
+    } else if (ch === '{') {
+      depth++;
+    } else if (ch === '}' && --depth === 0) {
+      return JSON.parse(html.slice(start, i + 1));
+    }
+  }
+
+  return null;
+}
+
+function findStringEnd(text, openQuote) {
+  let end = text.indexOf('"', openQuote + 1);
+  while (end !== -1) {
+    let backslashes = 0;
+    for (let j = end - 1; text[j] === '\\'; j--) backslashes++;
+    if (backslashes % 2 === 0) return end;
+    end = text.indexOf('"', end + 1);
+  }
+  return -1;
+}
+
+// 워치 페이지는 수 MB지만 플레이어 응답은 앞부분에 있으므로,
+// 해당 <script> 블록이 끝나면 나머지 본문은 받지 않고 연결을 끊음
+async function readWatchPage(response) {
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let html = '';
+  let markerIndex = -1;
+
+  while (true) {
+    const { done, value } = await reader.read();
+    if (done) break;
+
+    // 새 청크 부근만 검색 (경계에 걸친 마커/종료 태그를 위해 조금 겹쳐서)
+    const scanFrom = Math.max(0, html.length - SCAN_OVERLAP);
+    html += decoder.decode(value, { stream: true });
+
+    if (markerIndex === -1) {
+      RE_PLAYER_RESPONSE_SEARCH.lastIndex = scanFrom;
+      const match = RE_PLAYER_RESPONSE_SEARCH.exec(html);
+      if (match) markerIndex = match.index;
+    }
+    if (markerIndex !== -1 && html.indexOf('</script>', Math.max(markerIndex, scanFrom)) !== -1) {
+      await reader.cancel();
+      return html;
+    }
+  }
+
+  return html + decoder.decode();
+}
+
+// events[].segs[].utf8 문자열만 원문에서 직접 뽑아냄 (전체 JSON 트리를 만들지 않음)
+// "segs" 키가 나올 때마다 이벤트 경계로 보고 공백을 넣음
+const RE_CAPTION_TOKEN = /"segs"\s*:|"utf8"\s*:\s*("(?:[^"\\]|\\.)*")/g;
+
+function extractCaptionText(captionJson) {
+  let text = '';
+  for (const match of captionJson.matchAll(RE_CAPTION_TOKEN)) {
+    text += match[1] === undefined ? ' ' : JSON.parse(match[1]);
+  }
+  return text;
+}
+
 async function downloadTranscript(videoId, preferredLangs = ['ko', 'en']) {
   console.log(`\n📥 자막 다운로드 중... (videoId: ${videoId})`);
 
   const response = await fetch(`https://www.youtube.com/watch?v=${videoId}`, {
-    headers: {
-      'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-      'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7'
-    }
+    headers: HEADERS
   });
 
-  const html = await response.text();
+  const html = await readWatchPage(response);
 
   // 제목 추출
   const titleMatch = html.match(/<title>([^<]+)<\/title>/);
   const title = titleMatch ? titleMatch[1].replace(' - YouTube', '') : 'Unknown';
 
   // ytInitialPlayerResponse에서 자막 정보 추출
-  const playerResponseMatch = html.match(/ytInitialPlayerResponse\s*=\s*({.+?});/);
-  if (!playerResponseMatch) {
+  const playerResponse = extractPlayerResponse(html);
+  if (!playerResponse) {
     throw new Error('플레이어 응답을 찾을 수 없습니다');
   }
 
-  const playerResponse = JSON.parse(playerResponseMatch[1]);
   const captions = playerResponse?.captions?.playerCaptionsTracklistRenderer?.captionTracks;
 
   if (!captions || captions.length === 0) {
@@ -66,14 +154,11 @@ async function downloadTranscript(videoId, preferredLangs = ['ko', 'en']) {
 
   // 자막 다운로드
   const captionUrl = selectedCaption.baseUrl + '&fmt=json3';
-  const captionResponse = await fetch(captionUrl);
-  const captionData = await captionResponse.json();
+  const captionResponse = await fetch(captionUrl, { headers: HEADERS });
+  const captionJson = await captionResponse.text();
 
   // 텍스트 추출
-  const transcript = captionData.events
-    .filter(e => e.segs)
-    .map(e => e.segs.map(s => s.utf8).join(''))
-    .join(' ')
+  const transcript = extractCaptionText(captionJson)
     .replace(/\s+/g, ' ')
     .trim();
 
@@ -81,10 +166,13 @@ async function downloadTranscript(videoId, preferredLangs = ['ko', 'en']) {
 }
 
 // ============ 3. AI 처리 ============
+// 여러 영상을 처리할 때 클라이언트(커넥션 풀)를 재사용
+let client = null;
+
 async function processWithAI(transcript, title) {
   console.log(`\n🤖 Claude AI 처리 중...`);
 
-  const client = new Anthropic({ apiKey: API_KEY });
+  client ??= new Anthropic({ apiKey: API_KEY });
 
   const systemPrompt = `당신은 YouTube 영상 콘텐츠를 분석하여 포괄적인 학습 노트를 생성하는 전문가입니다.
 주어진 자막을 분석하여 다음 6개 섹션을 한국어로 작성해주세요.
@@ -127,54 +215,78 @@ ${transcript.substring(0, 15000)}
 }
 
 // ============ 메인 실행 ============
-async function main() {
-  console.log('🎬 YouTube Summary 플러그인 테스트');
-  console.log('='.repeat(50));
+async function summarizeVideo({ title, transcript }) {
+  console.log(`   제목: ${title}`);
+  console.log(`   자막 길이: ${transcript.length}자`);
+  console.log(`   자막 미리보기: ${transcript.substring(0, 200)}...`);
 
-  try {
-    // 1. 비디오 ID 추출
-    const videoId = extractVideoId(VIDEO_URL);
-    console.log(`\n✅ 비디오 ID 추출 성공: ${videoId}`);
+  // 3. AI 처리
+  const sections = await processWithAI(transcript, title);
+  console.log(`✅ AI 처리 성공\n`);
+
+  // 결과 출력
+  console.log('='.repeat(50));
+  console.log('📝 생성된 학습 노트');
+  console.log('='.repeat(50));
 
-    // 2. 자막 다운로드
-    const { title, transcript, language } = await downloadTranscript(videoId);
-    console.log(`✅ 자막 다운로드 성공`);
-    console.log(`   제목: ${title}`);
-    console.log(`   자막 길이: ${transcript.length}자`);
-    console.log(`   자막 미리보기: ${transcript.substring(0, 200)}...`);
+  console.log('\n## 📌 Executive Summary\n');
+  console.log(sections.executiveSummary);
 
-    // 3. AI 처리
-    const sections = await processWithAI(transcript, title);
-    console.log(`✅ AI 처리 성공\n`);
+  console.log('\n## 📚 챕터별 분석\n');
+  console.log(sections.chapterAnalysis);
 
-    // 결과 출력
-    console.log('='.repeat(50));
-    console.log('📝 생성된 학습 노트');
-    console.log('='.repeat(50));
+  console.log('\n## 💡 핵심 개념\n');
+  console.log(sections.keyConcepts);
 
-    console.log('\n## 📌 Executive Summary\n');
-    console.log(sections.executiveSummary);
+  console.log('\n## 📖 상세 학습 노트\n');
+  console.log(sections.detailedNotes);
 
-    console.log('\n## 📚 챕터별 분석\n');
-    console.log(sections.chapterAnalysis);
+  console.log('\n## ✅ 실행 아이템\n');
+  console.log(sections.actionItems);
 
-    console.log('\n## 💡 핵심 개념\n');
-    console.log(sections.keyConcepts);
+  console.log('\n## 🎯 쉬운 설명 (Feynman)\n');
+  console.log(sections.feynmanExplanation);
+}
 
-    console.log('\n## 📖 상세 학습 노트\n');
-    console.log(sections.detailedNotes);
+function reportError(error) {
+  console.error(`\n❌ 에러 발생: ${error.message}`);
+  if (error.stack) {
+    console.error(error.stack);
+  }
+}
 
-    console.log('\n## ✅ 실행 아이템\n');
-    console.log(sections.actionItems);
+async function main() {
+  console.log('🎬 YouTube Summary 플러그인 테스트');
+  console.log('='.repeat(50));
 
-    console.log('\n## 🎯 쉬운 설명 (Feynman)\n');
-    console.log(sections.feynmanExplanation);
+  try {
+    // 1. 비디오 ID 추출
+    const videoIds = VIDEO_URLS.map(extractVideoId);
+    console.log(`\n✅ 비디오 ID 추출 성공: ${videoIds.join(', ')}`);
+
+    // 2. 자막 다운로드 (모든 영상을 동시에 요청)
+    const downloads = await Promise.all(
+      videoIds.map(videoId => downloadTranscript(videoId).catch(error => error))
+    );
+
+    // AI 요청은 rate limit 때문에 순차 처리
+    for (let i = 0; i < videoIds.length; i++) {
+      const download = downloads[i];
+      if (download instanceof Error) {
+        reportError(download);
+        continue;
+      }
+
+      console.log(`\n✅ 자막 다운로드 성공 (${videoIds[i]})`);
+      try {
+        await summarizeVideo(download);
+      } catch (error) {
+        reportError(error);
+      }
+    }
 
   } catch (error) {
-    console.error(`\n❌ 에러 발생: ${error.message}`);
-    if (error.stack) {
-      console.error(error.stack);
-    }
+    reportError(error);
   }
 }
 